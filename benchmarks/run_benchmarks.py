@@ -0,0 +1,370 @@
+"""
+Benchmark suite for the data pipeline, model training and the `/predict`
+service.
+
+Every case runs against synthetic rows that follow the schema of
+`Extended_Employee_Performance_and_Productivity_Data.csv`, so neither the
+Kaggle download nor an MLflow tracking server is needed. The `/predict`
+case serves a model logged to a file-based MLflow store inside a
+temporary directory.
+
+Usage (from the project root)::
+
+    python benchmarks/run_benchmarks.py --sizes 1000 10000
+    python benchmarks/run_benchmarks.py --save-baseline
+    python benchmarks/run_benchmarks.py --threshold 0.25
+    python benchmarks/run_benchmarks.py --import-only
+
+The run exits with status 1 when any case is slower than the stored
+baseline by more than `--threshold`, or when `import commons` takes
+longer than `--import-budget` seconds in a fresh interpreter. With
+`--import-only`, only the import budget is checked, which takes seconds.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+from sklearn.ensemble import (GradientBoostingRegressor,
+                              RandomForestRegressor)
+from sklearn.model_selection import cross_val_score
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "notebooks"))
+
+from commons.commons import get_features  # noqa: E402
+from commons.load_data import (load_raw_data,  # noqa: E402
+                               transformed_employee_performance)
+from commons.engineer_features import (feature_training,  # noqa: E402
+                                       feature_engineer_prediction,
+                                       handle_features)
+from commons.synthetic_data import generate_employee_data  # noqa: E402
+from commons.drift import drift_reference  # noqa: E402
+
+DATASET_FILENAME = "Extended_Employee_Performance_and_Productivity_Data.csv"
+DEFAULT_SIZES = [1000, 10000]
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results.json"
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+PREDICT_BATCH_SIZE = 500
+DEFAULT_IMPORT_BUDGET = 0.5
+HEAVY_MODULES = ("pandas", "sklearn", "mlflow", "matplotlib", "seaborn",
+                 "xgboost", "lightgbm")
+
+## A fixed grid keeps the tuning sweep comparable between runs.
+TUNING_SWEEP = [
+    {"n_estimators": 20, "max_depth": 10, "min_samples_leaf": 1},
+    {"n_estimators": 20, "max_depth": 20, "min_samples_leaf": 4},
+    {"n_estimators": 40, "max_depth": 10, "min_samples_leaf": 8},
+]
+
+
+def time_case(func, setup=None, repeats: int=5) -> dict:
+    """
+    Time `func` over several repeats and summarize the wall-clock times.
+
+    Parameters
+    ----------
+    func : callable
+        Function under test. It receives the output of `setup` if given.
+    setup : callable, optional
+        Untimed function that prepares a fresh argument for each repeat,
+        which is needed for functions that mutate their input in place.
+    repeats : int, optional
+        Number of timed calls.
+
+    Returns
+    -------
+    dict
+        Median, minimum and maximum of the timings in seconds.
+    """
+    timings = []
+    for _ in range(repeats):
+        args = () if setup is None else (setup(),)
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return {"median_s": statistics.median(timings),
+            "min_s": min(timings),
+            "max_s": max(timings),
+            "repeats": repeats}
+
+
+def measure_import_time(module: str="commons", repeats: int=5) -> dict:
+    """
+    Time `import <module>` in fresh interpreters.
+
+    Parameters
+    ----------
+    module : str, optional
+        Module to import from the `notebooks` folder.
+    repeats : int, optional
+        Number of interpreters started.
+
+    Returns
+    -------
+    dict
+        Median, minimum and maximum import times in seconds, and the heavy
+        dependencies that the import loaded.
+    """
+    code = ("import sys, time; start = time.perf_counter(); "
+            f"import {module}; print(time.perf_counter() - start); "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} "
+            "if m in sys.modules))")
+    timings = []
+    for _ in range(repeats):
+        output = subprocess.run([sys.executable, "-c", code],
+                                cwd=ROOT / "notebooks", check=True,
+                                capture_output=True, text=True)
+        elapsed, loaded = output.stdout.splitlines()[-2:]
+        timings.append(float(elapsed))
+    return {"median_s": statistics.median(timings),
+            "min_s": min(timings),
+            "max_s": max(timings),
+            "repeats": repeats,
+            "loaded_heavy_modules": loaded.split(",") if loaded else []}
+
+
+def tuning_sweep(X: pd.DataFrame, y: pd.Series) -> float:
+    """Run the fixed random forest sweep and return the best CV score."""
+    scores = []
+    for params in TUNING_SWEEP:
+        model = RandomForestRegressor(random_state=42, n_jobs=-1, **params)
+        scores.append(cross_val_score(model, X, y, cv=3,
+                                      scoring='neg_mean_squared_error')
+                      .mean())
+    return max(scores)
+
+
+def load_predict_client(work_dir: str, X: pd.DataFrame, y: pd.Series):
+    """
+    Log a model and a drift reference to local files and return an
+    in-process client for the FastAPI app.
+
+    Parameters
+    ----------
+    work_dir : str
+        Directory holding the MLflow file store.
+    X : pd.DataFrame
+        Training features, shaped like a `/predict` payload.
+    y : pd.Series
+        Training target.
+
+    Returns
+    -------
+    fastapi.testclient.TestClient
+        Client bound to the app in `fastapi/app/api.py`.
+    """
+    import mlflow
+
+    ## Newer MLflow releases refuse the file store unless it is opted into.
+    os.environ.setdefault("MLFLOW_ALLOW_FILE_STORE", "true")
+    tracking_uri = Path(work_dir, "mlruns").as_uri()
+    mlflow.set_tracking_uri(tracking_uri)
+    mlflow.set_experiment("benchmarks")
+    model = GradientBoostingRegressor(n_estimators=50, random_state=42)
+    model.fit(X, y)
+    with mlflow.start_run():
+        model_info = mlflow.sklearn.log_model(
+            model, "model",
+            serialization_format=mlflow.sklearn.SERIALIZATION_FORMAT_CLOUDPICKLE
+        )
+
+    reference_path = os.path.join(work_dir, "drift_reference.json")
+    with open(reference_path, "w") as f:
+        json.dump(drift_reference(X), f)
+
+    os.environ["MLFLOW_TRACKING_URI"] = tracking_uri
+    os.environ["MLFLOW_MODEL_URI"] = model_info.model_uri
+    os.environ["DRIFT_REFERENCE_URI"] = reference_path
+    ## `fastapi/` would shadow the installed package on sys.path, so the
+    ## app module is loaded straight from its file.
+    spec = importlib.util.spec_from_file_location(
+        "benchmark_api", ROOT / "fastapi" / "app" / "api.py"
+    )
+    api = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(api)
+
+    from fastapi.testclient import TestClient
+    return TestClient(api.app)
+
+
+def run_size(n_rows: int, work_dir: str, repeats: int,
+             skip_predict: bool=False) -> dict:
+    """Run every benchmark case for a dataset of `n_rows` rows."""
+    target = get_features()['target'][0]
+    raw_df = generate_employee_data(n_rows)
+    csv_path = os.path.join(work_dir, f"{n_rows}_{DATASET_FILENAME}")
+    raw_df.to_csv(csv_path, index=False)
+
+    transformed_df = transformed_employee_performance(raw_df.copy())
+    engineered_df, X_scaler, _ = feature_training(transformed_df.copy(),
+                                                  return_scaler=True)
+    X_data = transformed_df.drop(columns=[target])
+    model_df = handle_features(engineered_df.copy())
+    X = model_df.drop(columns=[target])
+    y = model_df[target]
+
+    results = {}
+    results["load_raw_data"] = time_case(
+        lambda: load_raw_data(csv_path), repeats=repeats)
+    results["transformed_employee_performance"] = time_case(
+        transformed_employee_performance, setup=raw_df.copy,
+        repeats=repeats)
+    results["feature_training"] = time_case(
+        lambda df: feature_training(df, return_scaler=True),
+        setup=transformed_df.copy, repeats=repeats)
+    results["feature_training_compact"] = time_case(
+        lambda df: feature_training(df, return_scaler=True, compact=True),
+        setup=transformed_df.copy, repeats=repeats)
+    results["feature_engineer_prediction"] = time_case(
+        lambda df: feature_engineer_prediction(df, X_scaler),
+        setup=X_data.copy, repeats=repeats)
+    results["handle_features"] = time_case(
+        handle_features, setup=engineered_df.copy, repeats=repeats)
+    results["tuning_sweep"] = time_case(
+        lambda: tuning_sweep(X, y), repeats=1)
+
+    if not skip_predict:
+        client = load_predict_client(work_dir, X, y)
+        payload = json.loads(
+            X.iloc[:PREDICT_BATCH_SIZE].to_json(orient="records")
+        )
+
+        def post_predict():
+            response = client.post("/predict", json=payload)
+            response.raise_for_status()
+
+        results["predict"] = time_case(post_predict, repeats=repeats)
+        results["drift_report"] = time_case(
+            lambda: client.get("/drift").raise_for_status(), repeats=repeats)
+    return results
+
+
+def compare_to_baseline(results: dict, baseline: dict,
+                        threshold: float) -> list[str]:
+    """
+    List the cases whose median time regressed past the threshold.
+
+    Parameters
+    ----------
+    results : dict
+        Current results, keyed by dataset size and then case name.
+    baseline : dict
+        Stored results with the same layout.
+    threshold : float
+        Allowed relative slowdown, e.g. 0.25 for 25%.
+
+    Returns
+    -------
+    list of str
+        One message per regressed case.
+    """
+    regressions = []
+    for size, cases in results.items():
+        for case, timing in cases.items():
+            reference = baseline.get(size, {}).get(case)
+            if reference is None:
+                continue
+            ratio = timing["median_s"] / reference["median_s"]
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{case} @ {size} rows: {timing['median_s']:.4f}s vs "
+                    f"baseline {reference['median_s']:.4f}s "
+                    f"({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=DEFAULT_SIZES,
+                        help="Dataset sizes (rows) to benchmark.")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="Timed calls per case.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT,
+                        help="Where to write the JSON results.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="Stored baseline to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed relative slowdown per case.")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store this run as the new baseline.")
+    parser.add_argument("--skip-predict", action="store_true",
+                        help="Skip the /predict case.")
+    parser.add_argument("--import-budget", type=float,
+                        default=DEFAULT_IMPORT_BUDGET,
+                        help="Maximum median seconds for `import commons`.")
+    parser.add_argument("--import-only", action="store_true",
+                        help="Only check the import budget.")
+    return parser.parse_args(argv)
+
+
+def check_import_budget(budget: float) -> tuple[dict, bool]:
+    """Time `import commons` and report whether it exceeds `budget`."""
+    import_timing = measure_import_time()
+    print(f"import commons: {import_timing['median_s']:.4f}s "
+          f"(heavy modules loaded: "
+          f"{', '.join(import_timing['loaded_heavy_modules']) or 'none'})")
+    failed = import_timing["median_s"] > budget
+    if failed:
+        print(f"IMPORT BUDGET EXCEEDED: import commons took "
+              f"{import_timing['median_s']:.4f}s, budget is "
+              f"{budget:.4f}s")
+    return import_timing, failed
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    import_timing, failed = check_import_budget(args.import_budget)
+    if args.import_only:
+        return 1 if failed else 0
+
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for n_rows in args.sizes:
+            print(f"Benchmarking {n_rows} rows...")
+            results[str(n_rows)] = run_size(n_rows, work_dir, args.repeats,
+                                            skip_predict=args.skip_predict)
+            for case, timing in results[str(n_rows)].items():
+                print(f"  {case:<35} {timing['median_s']:.4f}s")
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "import_commons": import_timing,
+        "results": results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"Results saved to: {args.output}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to: {args.baseline}")
+        return 1 if failed else 0
+
+    if not args.baseline.exists():
+        print("No baseline found. Run with --save-baseline to create one.")
+        return 1 if failed else 0
+    baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    for message in regressions:
+        print(f"REGRESSION: {message}")
+    if not regressions:
+        print(f"No regressions above {args.threshold:.0%} of baseline.")
+    return 1 if regressions or failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
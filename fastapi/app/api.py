@@ -1,17 +1,173 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+import json
 import logging
+import os
+import threading
 import mlflow
+import numpy as np
 import pandas as pd
 
 app = FastAPI()
 
 logging.basicConfig(level=logging.INFO)
 
-mlflow.set_tracking_uri("http://tracking_server:5000")
-MLFLOW_MODEL_URI = "models:/gboost_regressor@champion"
+mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI",
+                                  "http://tracking_server:5000"))
+MLFLOW_MODEL_URI = os.getenv("MLFLOW_MODEL_URI",
+                             "models:/gboost_regressor@champion")
+## Reference summary written by `commons.drift.drift_reference` at training
+## time, as a local path or an MLflow artifact URI.
+DRIFT_REFERENCE_URI = os.getenv("DRIFT_REFERENCE_URI")
+PSI_ALERT_THRESHOLD = 0.2
+
+
+class DriftMonitor:
+    """
+    Constant-memory sketches of the features received by `/predict`.
+
+    Numeric features are counted in the fixed bins of the training
+    reference and one-hot encoded features per category, so memory depends
+    on the number of bins only, not on traffic. Counts are plain sums, so
+    sketches of several workers combine with `merge`.
+
+    Parameters
+    ----------
+    reference : dict
+        Output of `commons.drift.drift_reference`.
+    """
+    def __init__(self, reference: dict):
+        self.reference = reference
+        self.edges = {col: np.asarray(spec["edges"], dtype="float64")
+                      for col, spec in reference["numeric"].items()}
+        self.n = 0
+        self.counts = {
+            col: np.zeros(len(spec["counts"]), dtype="int64")
+            for kind in ("numeric", "categorical")
+            for col, spec in reference[kind].items()
+        }
+        self._lock = threading.Lock()
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Count a batch of request rows into the sketches."""
+        counts = {}
+        for col, edges in self.edges.items():
+            if col not in df.columns:
+                continue
+            values = pd.to_numeric(df[col], errors="coerce")
+            values = values.to_numpy(dtype="float64")
+            values = values[~np.isnan(values)]
+            counts[col] = np.bincount(
+                np.searchsorted(edges, values, side="right"),
+                minlength=len(edges) + 1
+            )
+        for col, spec in self.reference["categorical"].items():
+            indicators = (df.reindex(columns=spec["columns"], fill_value=0)
+                          .fillna(0).to_numpy(dtype="int64"))
+            counts[col] = np.append(indicators.sum(axis=0),
+                                    (indicators.sum(axis=1) == 0).sum())
+        self.merge(len(df), counts)
+
+    def merge(self, n: int, counts: dict) -> None:
+        """Add the row count and bin counts of another sketch."""
+        with self._lock:
+            self.n += n
+            for col, col_counts in counts.items():
+                self.counts[col] += np.asarray(col_counts, dtype="int64")
+
+    def report(self) -> dict:
+        """
+        Compare the sketches against the reference.
+
+        Returns
+        -------
+        dict
+            Population stability index per feature, the largest gap between
+            the binned CDFs (KS statistic) for numeric features, the features
+            whose PSI exceeds `PSI_ALERT_THRESHOLD` and the raw counts.
+            Scores are None for features without observations yet.
+        """
+        with self._lock:
+            n = self.n
+            counts = {col: c.copy() for col, c in self.counts.items()}
+
+        features = {}
+        for kind in ("numeric", "categorical"):
+            for col, spec in self.reference[kind].items():
+                if counts[col].sum() == 0:
+                    features[col] = {"psi": None}
+                    if kind == "numeric":
+                        features[col]["ks"] = None
+                    continue
+                expected = np.asarray(spec["counts"], dtype="float64")
+                expected /= expected.sum()
+                actual = counts[col] / counts[col].sum()
+                e = np.clip(expected, 1e-4, None)
+                a = np.clip(actual, 1e-4, None)
+                scores = {"psi": float(np.sum((a - e) * np.log(a / e)))}
+                if kind == "numeric":
+                    scores["ks"] = float(np.max(np.abs(np.cumsum(actual)
+                                                       - np.cumsum(expected))))
+                features[col] = scores
+
+        return {
+            "n_observations": n,
+            "psi_alert_threshold": PSI_ALERT_THRESHOLD,
+            "drifted_features": [col for col, scores in features.items()
+                                 if scores["psi"] is not None
+                                 and scores["psi"] > PSI_ALERT_THRESHOLD],
+            "features": features,
+            "counts": {col: c.tolist() for col, c in counts.items()},
+        }
+
+
+_drift_monitor = None
+_drift_reference_error = None
+_drift_monitor_lock = threading.Lock()
+
+
+def get_drift_monitor():
+    """
+    Load the drift reference on first use and return the shared monitor.
+
+    A failed load is logged once and remembered, so requests do not retry
+    the download. Returns None if no reference is configured or it could
+    not be loaded; restart the service to retry.
+    """
+    global _drift_monitor, _drift_reference_error
+    if (_drift_monitor is None and _drift_reference_error is None
+            and DRIFT_REFERENCE_URI):
+        with _drift_monitor_lock:
+            if _drift_monitor is None and _drift_reference_error is None:
+                try:
+                    path = DRIFT_REFERENCE_URI
+                    if not os.path.exists(path):
+                        path = mlflow.artifacts.download_artifacts(
+                            artifact_uri=DRIFT_REFERENCE_URI
+                        )
+                    with open(path) as f:
+                        _drift_monitor = DriftMonitor(json.load(f))
+                    logging.info("Loaded drift reference: "
+                                 f"{DRIFT_REFERENCE_URI}")
+                except Exception as e:
+                    _drift_reference_error = str(e)
+                    logging.exception("Failed to load the drift reference "
+                                      f"{DRIFT_REFERENCE_URI}. Drift "
+                                      "monitoring is disabled.")
+    return _drift_monitor
+
+
+def record_features(df: pd.DataFrame) -> None:
+    """Update the drift sketches after the response has been sent."""
+    try:
+        monitor = get_drift_monitor()
+        if monitor is not None:
+            monitor.update(df)
+    except Exception:
+        logging.exception("Failed to update the drift sketches.")
+
 
 @app.post("/predict")
-async def predict(data: list[dict]):
+async def predict(data: list[dict], background_tasks: BackgroundTasks):
     """
     Receives JSON data, loads the MLflow model, makes predictions, 
     and returns predictions in JSON format.
@@ -20,6 +176,8 @@ async def predict(data: list[dict]):
     ----------
     data : list
         List of dictionaries representing input features.
+    background_tasks : BackgroundTasks
+        Used to update the drift sketches off the request path.
     
     Returns
     -------
@@ -36,6 +194,7 @@ async def predict(data: list[dict]):
         logging.info("Starting predictions...")
         predictions = model.predict(df)
         logging.info("Completed predictions. Returning response to client...")
+        background_tasks.add_task(record_features, df)
         response = {
             "row_number": list(range(len(predictions))),
             "predicted_value": predictions.tolist(),
@@ -45,3 +204,26 @@ async def predict(data: list[dict]):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/drift")
+async def drift():
+    """
+    Reports drift of the features received by `/predict` against the
+    training reference.
+
+    Returns
+    -------
+    dict
+        PSI/KS scores per feature, as returned by `DriftMonitor.report`.
+    """
+    monitor = get_drift_monitor()
+    if _drift_reference_error is not None:
+        raise HTTPException(status_code=503,
+                            detail="Failed to load the drift reference: "
+                                   f"{_drift_reference_error}")
+    if monitor is None:
+        raise HTTPException(status_code=503,
+                            detail="No drift reference configured. "
+                                   "Set DRIFT_REFERENCE_URI.")
+    return monitor.report()
@@ -1,4 +1,26 @@
-from .load_data import load_raw_data
-from .load_data import transformed_employee_performance
-from .load_data import feature_engineered_employee_performance
-from .commons import one_hot_encode, standardize
\ No newline at end of file
+import importlib
+
+## Public names are resolved on first access, so `import commons` does not
+## pull in pandas, scikit-learn or MLflow until they are needed.
+_LAZY_ATTRIBUTES = {
+    "load_raw_data": "load_data",
+    "transformed_employee_performance": "load_data",
+    "feature_engineered_employee_performance": "load_data",
+    "one_hot_encode": "commons",
+    "standardize": "commons",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
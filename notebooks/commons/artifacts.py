@@ -0,0 +1,249 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+import mlflow
+from mlflow.tracking import MlflowClient
+
+
+class ArtifactUploadError(Exception):
+    """Error for artifacts that could not be rendered or uploaded."""
+    def __init__(self, message):
+        super().__init__(message)
+
+
+class ArtifactUploader:
+    """
+    Upload MLflow artifacts on a background thread.
+
+    Figures, tables and dictionaries are written to local files on the
+    calling thread, then queued with the run they belong to together with
+    plain files. A single worker thread uploads them, so training continues
+    while the artifact store is busy. Files up to `small_file_bytes` are staged per run and
+    uploaded together in one `log_artifacts` call on `flush`; larger files
+    are uploaded as soon as they are ready. Uploads are retried with
+    exponential backoff, and anything that still fails is raised from
+    `flush` as an `ArtifactUploadError`.
+
+    Parameters
+    ----------
+    max_queue_size : int, optional
+        Pending uploads allowed before the `log_*` methods block.
+    small_file_bytes : int, optional
+        Files up to this size are batched into one upload per run.
+    max_retries : int, optional
+        Upload attempts before a failure is reported.
+    retry_delay : float, optional
+        Seconds to wait before the first retry, doubled on every retry.
+    client : MlflowClient, optional
+        Client used for uploads. Defaults to one for the current tracking URI.
+
+    Notes
+    -----
+    Figures are rendered before `log_figure` returns, because matplotlib is
+    not thread-safe; only the upload happens in the background. Files
+    passed to `log_artifact` must exist until `flush` returns.
+    """
+    def __init__(self, max_queue_size: int=32,
+                 small_file_bytes: int=1_000_000,
+                 max_retries: int=3,
+                 retry_delay: float=1.0,
+                 client: MlflowClient=None):
+        self.small_file_bytes = small_file_bytes
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._client = MlflowClient() if client is None else client
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._staging = {}
+        self._pending_dir = tempfile.mkdtemp(prefix="artifacts_pending_")
+        self._errors = []
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, daemon=True,
+                                        name="artifact-uploader")
+        self._worker.start()
+        atexit.register(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def log_figure(self, fig, artifact_path: str, dpi: int=300,
+                   run_id: str=None) -> None:
+        """
+        Render a figure and queue it to be logged to a run.
+
+        Parameters
+        ----------
+        fig : matplotlib.figure.Figure or plotly.graph_objects.Figure
+            Matplotlib figures are saved as PNG, plotly figures as HTML.
+        artifact_path : str
+            Filename of the artifact.
+        dpi : int, optional
+            Resolution of matplotlib figures.
+        run_id : str, optional
+            Target run. Defaults to the active run.
+        """
+        run_id = self._resolve_run(run_id)
+        file_path = self._pending_path(artifact_path)
+        if hasattr(fig, "savefig"):
+            fig.savefig(file_path, format="png", dpi=dpi)
+        elif hasattr(fig, "write_html"):
+            fig.write_html(file_path)
+        else:
+            raise TypeError(f"Unsupported figure type: {type(fig)}")
+        self._submit("owned", run_id, file_path)
+
+    def log_table(self, df, artifact_path: str, run_id: str=None) -> None:
+        """Write a DataFrame as CSV and queue it to be logged to a run."""
+        run_id = self._resolve_run(run_id)
+        file_path = self._pending_path(artifact_path)
+        df.to_csv(file_path, index=False)
+        self._submit("owned", run_id, file_path)
+
+    def log_dict(self, dictionary: dict, artifact_path: str,
+                 run_id: str=None) -> None:
+        """
+        Write a dictionary as JSON (or YAML for a `.yaml`/`.yml` path) and
+        queue it to be logged to a run, like `mlflow.log_dict`.
+        """
+        run_id = self._resolve_run(run_id)
+        file_path = self._pending_path(artifact_path)
+        with open(file_path, "w") as f:
+            if artifact_path.endswith((".yaml", ".yml")):
+                import yaml
+                yaml.safe_dump(dictionary, f, default_flow_style=False)
+            else:
+                json.dump(dictionary, f, indent=2)
+        self._submit("owned", run_id, file_path)
+
+    def log_artifact(self, local_path: str, run_id: str=None) -> None:
+        """Queue a local file to be logged to a run (default: active run)."""
+        self._submit("file", run_id, local_path)
+
+    def flush(self) -> None:
+        """
+        Wait until every queued artifact has been uploaded.
+
+        Raises
+        ------
+        ArtifactUploadError
+            If any artifact failed since the last flush.
+        """
+        if self._closed:
+            return
+        self._queue.put(("flush", None, None))
+        self._queue.join()
+        if self._errors:
+            errors, self._errors = self._errors, []
+            raise ArtifactUploadError(
+                f"{len(errors)} artifact(s) failed:\n" + "\n".join(errors)
+            )
+
+    def close(self) -> None:
+        """Flush pending artifacts and stop the worker thread."""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._queue.put(("stop", None, None))
+            self._worker.join()
+            atexit.unregister(self.close)
+            ## Kept when an upload failed, since it then holds the files.
+            if not os.listdir(self._pending_dir):
+                os.rmdir(self._pending_dir)
+
+    def _resolve_run(self, run_id: str) -> str:
+        if self._closed:
+            raise RuntimeError("The artifact uploader is closed.")
+        if run_id is None:
+            active_run = mlflow.active_run()
+            if active_run is None:
+                raise RuntimeError("No active run to log the artifact to.")
+            run_id = active_run.info.run_id
+        return run_id
+
+    def _submit(self, kind: str, run_id: str, payload) -> None:
+        self._queue.put((kind, self._resolve_run(run_id), payload))
+
+    def _run(self) -> None:
+        while True:
+            kind, run_id, payload = self._queue.get()
+            try:
+                if kind == "stop":
+                    return
+                if kind == "flush":
+                    self._upload_batches()
+                elif kind in ("owned", "file"):
+                    self._stage(run_id, payload, owned=kind == "owned")
+            except Exception as e:
+                self._errors.append(f"{kind} for run {run_id}: {e!r}")
+            finally:
+                self._queue.task_done()
+
+    def _staging_dir(self, run_id: str) -> str:
+        if run_id not in self._staging:
+            self._staging[run_id] = tempfile.mkdtemp(prefix="artifacts_")
+        return self._staging[run_id]
+
+    def _pending_path(self, artifact_path: str) -> str:
+        """
+        Return a path named `artifact_path` in a fresh directory owned by
+        the uploader, so equal names from different runs do not collide.
+        """
+        return os.path.join(tempfile.mkdtemp(dir=self._pending_dir),
+                            artifact_path)
+
+    def _stage(self, run_id: str, file_path: str, owned: bool=False) -> None:
+        """
+        Keep small files for the batch upload, upload large ones now.
+        Files owned by the uploader are moved rather than copied, and
+        removed once uploaded.
+        """
+        if os.path.getsize(file_path) > self.small_file_bytes:
+            self._with_retries(self._client.log_artifact, run_id, file_path)
+            if owned:
+                shutil.rmtree(os.path.dirname(file_path))
+        elif owned:
+            os.replace(file_path, os.path.join(self._staging_dir(run_id),
+                                               os.path.basename(file_path)))
+            os.rmdir(os.path.dirname(file_path))
+        else:
+            shutil.copy(file_path, self._staging_dir(run_id))
+
+    def _upload_batches(self) -> None:
+        for run_id, staging_dir in list(self._staging.items()):
+            del self._staging[run_id]
+            if not os.listdir(staging_dir):
+                shutil.rmtree(staging_dir)
+                continue
+            try:
+                self._with_retries(self._client.log_artifacts,
+                                   run_id, staging_dir)
+            except Exception as e:
+                self._errors.append(
+                    f"batch upload for run {run_id} (files kept in "
+                    f"{staging_dir}): {e!r}"
+                )
+            else:
+                shutil.rmtree(staging_dir)
+
+    def _with_retries(self, upload, *args) -> None:
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                return upload(*args)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_delay * 2 ** (attempt - 1)
+                logging.warning(f"Artifact upload failed ({e!r}), "
+                                f"retrying in {delay:.1f}s...")
+                time.sleep(delay)
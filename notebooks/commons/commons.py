@@ -1,6 +1,5 @@
 import pandas as pd
 import tempfile
-import mlflow
 from sklearn.preprocessing import StandardScaler
 
 def get_features():
@@ -44,7 +43,7 @@ def standardize(df, columns: list,
     return standardized_df
 
 
-def log_figure(fig, artifact_path):
+def log_figure(fig, artifact_path, uploader=None):
     """
     Log a matplotlib figure as an artifact in MLflow.
 
@@ -54,6 +53,9 @@ def log_figure(fig, artifact_path):
         Provide the figure object to log.
     artifact_path : str, optional
         Specify the filename for the artifact (default is 'figure.png').
+    uploader : ArtifactUploader, optional
+        Render and upload the figure in the background through this
+        uploader instead of blocking until the upload is done.
 
     Returns
     -------
@@ -65,7 +67,39 @@ def log_figure(fig, artifact_path):
     URI setting is assumed to be done outside this function. Set the
     correct MLFlow URI prior to execution.
     """
+    if uploader is not None:
+        uploader.log_figure(fig, artifact_path)
+        return
+    import mlflow
     with tempfile.TemporaryDirectory() as temp_dir:
         file_path = f"{temp_dir}/{artifact_path}"
         fig.savefig(file_path, format="png", dpi=300)
+        mlflow.log_artifact(file_path)
+
+def log_table(df: pd.DataFrame, artifact_path, uploader=None):
+    """
+    Log a DataFrame as a CSV artifact in MLflow.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Provide the table to log.
+    artifact_path : str
+        Specify the filename for the artifact.
+    uploader : ArtifactUploader, optional
+        Upload the CSV in the background through this uploader instead of
+        blocking until the upload is done.
+
+    Returns
+    -------
+    None
+        Log the table as an artifact in the active MLflow run.
+    """
+    if uploader is not None:
+        uploader.log_table(df, artifact_path)
+        return
+    import mlflow
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = f"{temp_dir}/{artifact_path}"
+        df.to_csv(file_path, index=False)
         mlflow.log_artifact(file_path)
\ No newline at end of file
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+from .commons import get_features
+
+
+def drift_reference(X: pd.DataFrame, n_bins: int=10) -> dict:
+    """
+    Summarize the training features for drift monitoring in the service.
+
+    Parameters
+    ----------
+    X : pd.DataFrame
+        Engineered features shaped like a `/predict` payload, e.g. `X_train`.
+    n_bins : int, optional
+        Number of quantile bins per numeric feature. Discrete features end
+        up with fewer bins when quantiles coincide. Edges are placed midway
+        between observed values.
+
+    Returns
+    -------
+    dict
+        JSON-serializable reference. Numeric features hold the interior bin
+        `edges` and the reference `counts`, where a value `x` falls in bin
+        `searchsorted(edges, x, side="right")`. One-hot encoded features hold
+        their indicator `columns` and `counts`, with the category dropped by
+        `drop_first` counted in the last slot for rows with no indicator set.
+
+    Notes
+    -----
+    Log it next to the model with `mlflow.log_dict(reference,
+    "drift_reference.json")` and point `DRIFT_REFERENCE_URI` of the FastAPI
+    service to it.
+    """
+    features = get_features()
+    reference = {"n": len(X), "numeric": {}, "categorical": {}}
+
+    for col in features['numeric_columns']:
+        values = X[col].to_numpy(dtype="float64")
+        values = values[~np.isnan(values)]
+        quantiles = np.quantile(values, np.linspace(0, 1, n_bins + 1)[1:-1])
+        # Move each edge halfway to the next observed value, so values of
+        # discrete features never sit on an edge where rounding in the JSON
+        # payload could flip their bin.
+        observed = np.unique(values)
+        upper = np.searchsorted(observed, quantiles, side="right")
+        upper = np.unique(upper[upper < len(observed)])
+        edges = (observed[upper - 1] + observed[upper]) / 2
+        counts = np.bincount(np.searchsorted(edges, values, side="right"),
+                             minlength=len(edges) + 1)
+        reference["numeric"][col] = {"edges": edges.tolist(),
+                                     "counts": counts.tolist()}
+
+    for col in features['one_hot_encode_columns']:
+        columns = [c for c in X.columns if c.startswith(f"{col}_")]
+        indicators = X[columns].to_numpy(dtype="int64")
+        counts = indicators.sum(axis=0).tolist()
+        counts.append(int((indicators.sum(axis=1) == 0).sum()))
+        reference["categorical"][col] = {"columns": columns,
+                                         "counts": counts}
+    return reference
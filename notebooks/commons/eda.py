@@ -1,29 +1,245 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
 from .commons import get_features
+from .load_data import transformed_employee_performance
+from .synthetic_data import DEFAULT_PROFILE
 
 ## Functions branched out from from 
 ## https://mlflow.org/docs/latest/traditional-ml/hyperparameter-tuning-with-child-runs/notebooks/hyperparameter-tuning-with-child-runs.html
 
+
+class StreamingCorrelation:
+    """
+    Accumulate the pairwise means and co-moments of numeric columns chunk
+    by chunk.
+
+    Each chunk is reduced to per-pair counts, means, sums of squared
+    deviations and centered cross-products in float64, then merged into the
+    running totals with the pairwise update of Chan et al. Like
+    `DataFrame.corr()`, every pair of columns uses the rows where both are
+    present (pairwise-complete), so a NaN only removes its row from the
+    pairs of that column. Memory therefore depends on the number of
+    columns and the chunk size, never on the total row count. Partial
+    results from separate workers combine with `merge`.
+
+    Parameters
+    ----------
+    columns : list of str, optional
+        Columns to summarize. If None, the columns of the first chunk are
+        used. Columns missing from a later chunk are treated as zero, which
+        is what a one-hot indicator absent from that chunk means; extra
+        columns in a chunk are ignored.
+    """
+    def __init__(self, columns: list=None):
+        self.columns = None if columns is None else list(columns)
+        self.n = 0
+        self.count = None
+        self.mean = None
+        self.m2 = None
+        self.comoment = None
+
+    def update(self, chunk: pd.DataFrame) -> "StreamingCorrelation":
+        """Fold a chunk of rows into the summary."""
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+        values = (chunk.reindex(columns=self.columns, fill_value=0)
+                  .to_numpy(dtype="float64"))
+        if len(values) == 0:
+            return self
+        present = (~np.isnan(values)).astype("float64")
+        # Shifting by the column means keeps the sums below well conditioned.
+        shift = (np.nansum(values, axis=0)
+                 / np.maximum(present.sum(axis=0), 1))
+        values = np.nan_to_num(values - shift)
+        # Entry [i, j] of each matrix covers the rows where columns i and j
+        # are both present; the statistics of column j are the transposes.
+        count = present.T @ present
+        sums = values.T @ present
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.where(count > 0, sums / count, 0.0)
+        m2 = (values ** 2).T @ present - mean * sums
+        comoment = values.T @ values - mean * sums.T
+        return self._combine(len(values), count, mean + shift[:, None],
+                             m2, comoment)
+
+    def merge(self, other: "StreamingCorrelation") -> "StreamingCorrelation":
+        """Fold the summary of another accumulator into this one."""
+        if other.n == 0:
+            return self
+        if self.columns is None:
+            self.columns = list(other.columns)
+        elif self.columns != other.columns:
+            raise ValueError("Cannot merge summaries of different columns.")
+        return self._combine(other.n, other.count, other.mean, other.m2,
+                             other.comoment)
+
+    def _combine(self, n, count, mean, m2, comoment):
+        if self.n == 0:
+            self.n, self.count = n, count.copy()
+            self.mean, self.m2 = mean.copy(), m2.copy()
+            self.comoment = comoment.copy()
+            return self
+        total = self.count + count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = np.where(total > 0, self.count * count / total, 0.0)
+            share = np.where(total > 0, count / total, 0.0)
+        delta = mean - self.mean
+        self.comoment = self.comoment + comoment + delta * delta.T * weight
+        self.m2 = self.m2 + m2 + delta ** 2 * weight
+        self.mean = self.mean + delta * share
+        self.count = total
+        self.n += n
+        return self
+
+    def corr(self) -> pd.DataFrame:
+        """
+        Return the Pearson correlation matrix of the summarized rows.
+        Pairs with fewer than two complete rows are NaN.
+        """
+        if self.n < 2:
+            raise ValueError("At least two rows are needed for correlation.")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = self.comoment / np.sqrt(self.m2 * self.m2.T)
+        corr[self.count < 2] = np.nan
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+def correlation_features(chunk: pd.DataFrame,
+                         categories: dict=None) -> pd.DataFrame:
+    """
+    Prepare a chunk of raw records for `correlation_summary`.
+
+    Applies `transformed_employee_performance` and one-hot encodes against
+    fixed categories, dropping the first as `one_hot_encode` does, so that
+    every chunk yields the same indicator columns. Nothing is standardized:
+    Pearson correlations do not depend on the scale of a column, so the
+    result matches the correlations of the engineered training frame.
+
+    Parameters
+    ----------
+    chunk : pd.DataFrame
+        Raw employee records, e.g. a chunk of `load_raw_data(chunksize=...)`.
+    categories : dict, optional
+        Categories of each one-hot encoded column. Defaults to the
+        categories of `synthetic_data.DEFAULT_PROFILE`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The transformed chunk.
+
+    Notes
+    -----
+    Do not use `feature_training` as the transform of a streamed dataset:
+    it would standardize every chunk with its own statistics, so the pooled
+    correlations would be wrong.
+    """
+    if categories is None:
+        categories = {col: spec["values"] for col, spec
+                      in DEFAULT_PROFILE["categorical"].items()}
+    chunk = transformed_employee_performance(chunk.copy())
+    encode_columns = get_features()['one_hot_encode_columns']
+    for col in encode_columns:
+        chunk[col] = pd.Categorical(chunk[col],
+                                    categories=sorted(categories[col]))
+    return pd.get_dummies(chunk, columns=encode_columns, drop_first=True)
+
+
+def _summarize_file(task: tuple) -> StreamingCorrelation:
+    """Summarize one CSV or parquet file in a worker process."""
+    path, transform, columns, chunksize = task
+    if str(path).endswith(".parquet"):
+        chunks = [pd.read_parquet(path)]
+    else:
+        chunks = pd.read_csv(path, chunksize=chunksize)
+    summary = StreamingCorrelation(columns)
+    for chunk in chunks:
+        summary.update(chunk if transform is None else transform(chunk))
+    return summary
+
+
+def correlation_summary(data, columns: list=None, chunksize: int=100_000,
+                        transform=None,
+                        n_jobs: int=None) -> StreamingCorrelation:
+    """
+    Build a correlation summary in one pass over a dataset.
+
+    Parameters
+    ----------
+    data : pd.DataFrame, iterable of pd.DataFrame or list of str
+        An in-memory frame, an iterable of chunks (e.g. the reader returned
+        by `pd.read_csv(..., chunksize=...)`) or a list of CSV/parquet file
+        paths, such as the part files of `write_synthetic_dataset`.
+    columns : list of str, optional
+        Columns to summarize. Pass them explicitly when chunks may not
+        contain every one-hot indicator.
+    chunksize : int, optional
+        Rows folded in per update for frames and CSV files.
+    transform : callable, optional
+        Applied to each chunk before it is summarized, e.g.
+        `correlation_features`. Must be picklable for file inputs, and
+        must not fit anything per chunk: standardizing each chunk with its
+        own statistics (as `feature_training` does) makes the pooled
+        correlations wrong.
+    n_jobs : int, optional
+        Worker processes used for a list of files. Defaults to the CPU count.
+
+    Returns
+    -------
+    StreamingCorrelation
+        The merged summary of every row.
+    """
+    if isinstance(data, pd.DataFrame):
+        frame = data
+        data = (frame.iloc[start:start + chunksize]
+                for start in range(0, len(frame), chunksize))
+    elif isinstance(data, (list, tuple)) and data and isinstance(data[0], str):
+        tasks = [(path, transform, columns, chunksize) for path in data]
+        summary = StreamingCorrelation(columns)
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            for partial in executor.map(_summarize_file, tasks):
+                summary.merge(partial)
+        return summary
+
+    summary = StreamingCorrelation(columns)
+    for chunk in data:
+        summary.update(chunk if transform is None else transform(chunk))
+    return summary
+
+
+def _correlation_matrix(data_df) -> pd.DataFrame:
+    if isinstance(data_df, StreamingCorrelation):
+        return data_df.corr()
+    return correlation_summary(data_df).corr()
+
 def plot_correlation_with_scores(data_df,
-                                 save_path=None):
+                                 save_path=None,
+                                 dpi: int=150):
     """
     Plot the correlation of each variable in the dataframe with the target column.
 
     Parameters
     ----------
-    data_df : pd.DataFrame
-        The input DataFrame containing features and the target variable.
+    data_df : pd.DataFrame or StreamingCorrelation
+        The input DataFrame containing features and the target variable, or
+        a summary of it built with `correlation_summary`.
     save_path : str, optional
         File path to save the plot as a PNG. If None, the plot is only displayed.
+    dpi : int, optional
+        Resolution of the saved PNG.
 
     Returns
     -------
     matplotlib.figure.Figure
         The generated correlation plot.
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     target = get_features()['target'][0]
-    correlations = data_df.corr()[target].drop(target).sort_values()
+    correlations = (_correlation_matrix(data_df)[target]
+                    .drop(target).sort_values())
     colors = sns.diverging_palette(10, 130, as_cmap=True)
     color_mapped = correlations.map(colors)
     sns.set_style(
@@ -32,7 +248,7 @@ def plot_correlation_with_scores(data_df,
     fig = plt.figure(figsize=(12, 8))
     plt.barh(correlations.index,
              correlations.values, color=color_mapped)
-    plt.title(f"Correlation with {target.replace("_", " ")}", fontsize=18)
+    plt.title(f"Correlation with {target.replace('_', ' ')}", fontsize=18)
     plt.xlabel("Correlation Coefficient", fontsize=16)
     plt.ylabel("Variable", fontsize=16)
     plt.xticks(fontsize=14)
@@ -41,32 +257,38 @@ def plot_correlation_with_scores(data_df,
     plt.tight_layout()
     if save_path:
         plt.savefig(save_path, format="png",
-                    dpi=600)
+                    dpi=dpi)
     plt.close(fig)
     return fig
 
 
-def plot_correlation_matrix(data_df, save_path=None):
+def plot_correlation_matrix(data_df, save_path=None, dpi: int=150):
     """
     Plot the correlation matrix for all features in the DataFrame, including 
     the target variable, with negative correlations in red.
 
     Parameters
     ----------
-    data_df : pd.DataFrame
-        The input DataFrame containing features and the target variable.
+    data_df : pd.DataFrame or StreamingCorrelation
+        The input DataFrame containing features and the target variable, or
+        a summary of it built with `correlation_summary`.
     save_path : str, optional
         File path to save the plot as a PNG. If None, the plot is only displayed.
+    dpi : int, optional
+        Resolution of the saved PNG.
 
     Returns
     -------
     matplotlib.figure.Figure
         The generated correlation heatmap.
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     sns.set(style="whitegrid")
 
     # Compute the correlation matrix
-    corr_matrix = data_df.corr()
+    corr_matrix = _correlation_matrix(data_df)
 
     # Adjust figure size dynamically based on number of features
     fig_size = max(10, len(corr_matrix) * 0.7)
@@ -96,7 +318,7 @@ def plot_correlation_matrix(data_df, save_path=None):
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, format="png", dpi=600)
+        plt.savefig(save_path, format="png", dpi=dpi)
 
     plt.close(fig)
     return fig
\ No newline at end of file
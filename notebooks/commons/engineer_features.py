@@ -3,12 +3,40 @@ from .commons import one_hot_encode, get_features
 from sklearn.preprocessing import StandardScaler
 
 
+def _compact_features(data_df: pd.DataFrame, std_columns: dict,
+                      reset_index: bool=False) -> pd.DataFrame:
+    """
+    Assemble the engineered frame from the scaled columns, the untouched
+    columns of `data_df` and uint8 one-hot indicators, in the column order
+    of the default path. Float columns are stored as float32.
+    """
+    encode_columns = get_features()['one_hot_encode_columns']
+    columns = {}
+    for col in data_df.columns:
+        if col in encode_columns:
+            continue
+        if col in std_columns:
+            columns[col] = std_columns[col]
+        elif pd.api.types.is_float_dtype(data_df[col]):
+            columns[col] = data_df[col].to_numpy(dtype='float32')
+        else:
+            columns[col] = data_df[col].to_numpy()
+
+    dummies = pd.get_dummies(data_df[encode_columns],
+                             drop_first=True, dtype='uint8')
+    for col in dummies.columns:
+        columns[col] = dummies[col].to_numpy()
+
+    index = pd.RangeIndex(len(data_df)) if reset_index else data_df.index
+    return pd.DataFrame(columns, index=index, copy=False)
+
 def feature_training(
         data_df: pd.DataFrame,
         X_scaler: StandardScaler = None,
         y_scaler: StandardScaler = None,
         reset_index: bool = False,
-        return_scaler: bool = False
+        return_scaler: bool = False,
+        compact: bool = False
     ) -> tuple[pd.DataFrame, StandardScaler,
                StandardScaler]:
     """
@@ -24,6 +52,9 @@ def feature_training(
         Whether to reset the index of the returned DataFrame.
     return_scaler : bool, optional
         If True, returns both the transformed DataFrame and the scaler.
+    compact : bool, optional
+        If True, build the frame with uint8 one-hot indicators and float32
+        numeric columns, assembled in a single pass.
 
     Returns
     -------
@@ -35,16 +66,27 @@ def feature_training(
 
     def scale_data(columns: list,
                    sub_scaler: StandardScaler=None):
+        values = data_df[columns]
+        if compact:
+            values = values.astype('float32')
         if sub_scaler is None:
             sub_scaler = StandardScaler()
-            std_values = sub_scaler.fit_transform(data_df[columns])
+            std_values = sub_scaler.fit_transform(values)
         else:
-            std_values = sub_scaler.transform(data_df[columns])
+            std_values = sub_scaler.transform(values)
         return (std_values, sub_scaler)
 
     X_std_values, X_scaler = scale_data(numeric_columns, X_scaler)
     y_std_values, y_scaler = scale_data(target_column, y_scaler)
 
+    if compact:
+        std_columns = dict(zip(numeric_columns, X_std_values.T))
+        std_columns[target_column[0]] = y_std_values[:, 0]
+        new_df = _compact_features(data_df, std_columns, reset_index)
+        if not return_scaler:
+            return new_df
+        return new_df, X_scaler, y_scaler
+
     std_df = pd.DataFrame(X_std_values,
                           columns=numeric_columns)
     std_df[target_column[0]] = y_std_values
@@ -72,7 +114,8 @@ def feature_training(
 
 def feature_engineer_prediction(X_data: pd.DataFrame,
                                 X_scaler: StandardScaler,
-                                reset_index: bool=False) -> pd.DataFrame:
+                                reset_index: bool=False,
+                                compact: bool=False) -> pd.DataFrame:
     """
     Perform feature engineering on the input data, including scaling numeric features,
     one-hot encoding categorical features, and resetting the index if specified.
@@ -90,6 +133,10 @@ def feature_engineer_prediction(X_data: pd.DataFrame,
         Whether to reset the index of the resulting DataFrame. If True, the index 
         will be reset and the old index will be discarded.
 
+    compact : bool, default=False
+        If True, build the frame with uint8 one-hot indicators and float32
+        numeric columns, assembled in a single pass.
+
     Returns
     -------
     pd.DataFrame
@@ -109,15 +156,23 @@ def feature_engineer_prediction(X_data: pd.DataFrame,
 
     def scale_data(columns: list,
                    sub_scaler: StandardScaler=None):
+        values = X_data[columns]
+        if compact:
+            values = values.astype('float32')
         if sub_scaler is None:
             sub_scaler = StandardScaler()
-            std_values = sub_scaler.fit_transform(X_data[columns])
+            std_values = sub_scaler.fit_transform(values)
         else:
-            std_values = sub_scaler.transform(X_data[columns])
+            std_values = sub_scaler.transform(values)
         return (std_values, sub_scaler)
 
     X_std_values, X_scaler = scale_data(numeric_columns, X_scaler)
 
+    if compact:
+        return _compact_features(X_data,
+                                 dict(zip(numeric_columns, X_std_values.T)),
+                                 reset_index)
+
     std_df = pd.DataFrame(X_std_values,
                           columns=numeric_columns)
 
@@ -146,7 +201,8 @@ def feature_engineered_employee_performance(
         X_scaler: StandardScaler = None,
         y_scaler: StandardScaler = None,
         reset_index: bool = False,
-        return_scaler: bool = False
+        return_scaler: bool = False,
+        compact: bool = False
     ) -> tuple[pd.DataFrame, StandardScaler,
                StandardScaler] | pd.DataFrame:
     """
@@ -179,6 +235,11 @@ def feature_engineered_employee_performance(
         If True, returns both the transformed DataFrame and the scaler(s) 
         (i.e., the fitted `X_scaler` and `y_scaler`).
 
+    compact : bool, optional, default=False
+        If True, the returned frame uses uint8 one-hot indicators and float32
+        numeric columns instead of bool and float64. Scikit-learn and the
+        boosting libraries accept it as is.
+
     Returns
     -------
     pd.DataFrame
@@ -202,11 +263,13 @@ def feature_engineered_employee_performance(
     elif data_df is not None and X_data is None:
         return feature_training(data_df=data_df,
                          reset_index=reset_index,
-                         return_scaler=return_scaler)
+                         return_scaler=return_scaler,
+                         compact=compact)
     elif data_df is None and X_data is not None:
         return feature_engineer_prediction(X_data=X_data,
                                     X_scaler=X_scaler,
-                                    reset_index=reset_index)
+                                    reset_index=reset_index,
+                                    compact=compact)
 
 def handle_features(engineered_df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -0,0 +1,232 @@
+import logging
+import os
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+from .commons import get_features
+from .engineer_features import feature_training
+from .load_data import transformed_employee_performance
+from .synthetic_data import DEFAULT_PROFILE
+
+
+class IncrementalFeatureStore:
+    """
+    Persisted store of engineered training features that is refreshed with
+    appended employee records only.
+
+    The store keeps a watermark on the highest `Employee_ID` it has seen.
+    `refresh` engineers the rows above it, updates the `StandardScaler`
+    statistics with `partial_fit` on those rows alone and appends the result
+    as a new parquet part, so the cost grows with the new data rather than
+    the whole history. Each part remembers the scaler statistics it was
+    standardized with; once the scalers drift from them by more than
+    `tolerance`, `restandardize` rescales the stored parts one at a time,
+    saving the state after each, so an interrupted rescale can be resumed.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the store. Created on the first refresh.
+    tolerance : float, optional
+        Largest allowed shift of a scaler mean (in units of the old scale)
+        or relative change of a scale before the store counts as drifted.
+    compact : bool, optional
+        Store uint8 indicators and float32 numerics, as in `feature_training`.
+    categories : dict, optional
+        Categories of each one-hot encoded column of a new store. Defaults
+        to the categories of `synthetic_data.DEFAULT_PROFILE`. An existing
+        store keeps the categories it was created with.
+
+    Notes
+    -----
+    Records with a category outside `categories` raise a ValueError, since
+    their columns would not exist in the stored parts; rebuild the store
+    with the extended categories in that case.
+    """
+    STATE_FILE = "state.joblib"
+    PARTS_DIR = "features"
+    ID_COLUMN = "Employee_ID"
+
+    def __init__(self, path: str, tolerance: float=0.05,
+                 compact: bool=False, categories: dict=None):
+        self.path = path
+        self.tolerance = tolerance
+        self.compact = compact
+        state_path = os.path.join(path, self.STATE_FILE)
+        if os.path.exists(state_path):
+            self.state = joblib.load(state_path)
+        else:
+            if categories is None:
+                categories = {col: spec["values"] for col, spec
+                              in DEFAULT_PROFILE["categorical"].items()}
+            # Sorted like `pd.get_dummies`, so `drop_first` drops the same
+            # category as `one_hot_encode` does.
+            categories = {col: sorted(categories[col]) for col
+                          in get_features()['one_hot_encode_columns']}
+            self.state = {"watermark": None, "X_scaler": None,
+                          "y_scaler": None, "categories": categories,
+                          "parts": []}
+
+    @property
+    def watermark(self):
+        """Highest `Employee_ID` already in the store."""
+        return self.state["watermark"]
+
+    def refresh(self, data_df: pd.DataFrame,
+                restandardize: bool=False) -> pd.DataFrame:
+        """
+        Engineer and append the records above the watermark.
+
+        Parameters
+        ----------
+        data_df : pd.DataFrame
+            Raw employee records as loaded by `load_raw_data`. Records at or
+            below the watermark are skipped, and `data_df` is not modified.
+        restandardize : bool, optional
+            If True and the scalers drifted beyond `tolerance` after the
+            update, rescale every stored part to the current statistics.
+
+        Returns
+        -------
+        pd.DataFrame
+            The engineered new records (empty if there were none).
+
+        Raises
+        ------
+        ValueError
+            If the new records contain a category unseen by the store.
+        """
+        features = get_features()
+        if self.watermark is not None:
+            data_df = data_df[data_df[self.ID_COLUMN] > self.watermark]
+        if data_df.empty:
+            return pd.DataFrame()
+        delta = transformed_employee_performance(data_df.copy())
+        delta = self._encode_categories(delta)
+
+        if self.state["X_scaler"] is None:
+            self.state["X_scaler"] = StandardScaler()
+            self.state["y_scaler"] = StandardScaler()
+        X_scaler = self.state["X_scaler"].partial_fit(
+            delta[features['numeric_columns']])
+        y_scaler = self.state["y_scaler"].partial_fit(
+            delta[features['target']])
+        delta_df = feature_training(delta, X_scaler=X_scaler,
+                                    y_scaler=y_scaler, reset_index=True,
+                                    compact=self.compact)
+
+        parts_dir = os.path.join(self.path, self.PARTS_DIR)
+        os.makedirs(parts_dir, exist_ok=True)
+        part_file = f"part-{len(self.state['parts']):05d}.parquet"
+        delta_df.to_parquet(os.path.join(parts_dir, part_file), index=False)
+        self.state["parts"].append({"file": part_file,
+                                    "rows": len(delta_df),
+                                    **self._scaler_stats()})
+        self.state["watermark"] = int(delta[self.ID_COLUMN].max())
+
+        drift = self.drift()
+        if drift > self.tolerance:
+            if restandardize:
+                self.restandardize()
+            else:
+                logging.warning(f"Scaler drift {drift:.4f} exceeds the "
+                                f"tolerance {self.tolerance}. Refresh with "
+                                "`restandardize=True` to rescale the store.")
+        self._save_state()
+        return delta_df
+
+    def drift(self) -> float:
+        """
+        Largest change of the scaler statistics relative to the statistics
+        any stored part was standardized with.
+        """
+        current = self._scaler_stats()
+        largest = 0.0
+        for part in self.state["parts"]:
+            for prefix in ("X", "y"):
+                mean, scale = part[f"{prefix}_mean"], part[f"{prefix}_scale"]
+                largest = max(
+                    largest,
+                    np.max(np.abs(current[f"{prefix}_mean"] - mean) / scale),
+                    np.max(np.abs(current[f"{prefix}_scale"] / scale - 1))
+                )
+        return float(largest)
+
+    def restandardize(self) -> None:
+        """
+        Rescale every stored part to the current scaler statistics.
+
+        Each rescaled part is written to a temporary file and moved to a new
+        revision of the part file. Saving the state, which switches the part
+        to that revision and its statistics, happens before the next part
+        and is the only step that commits a part, so the recorded
+        statistics always match the file they point to. An interrupted
+        rescale is resumed by calling `restandardize` again.
+        """
+        features = get_features()
+        current = self._scaler_stats()
+        groups = (("X", features['numeric_columns']),
+                  ("y", features['target']))
+        parts_dir = os.path.join(self.path, self.PARTS_DIR)
+        for i, part in enumerate(self.state["parts"]):
+            if all(np.array_equal(part[key], value)
+                   for key, value in current.items()):
+                continue
+            part_df = pd.read_parquet(os.path.join(parts_dir, part["file"]))
+            for prefix, columns in groups:
+                # Undo the scaling the part was stored with, then apply the
+                # current one, without going back to the raw records.
+                values = part_df[columns].to_numpy(dtype="float64")
+                values = ((values * part[f"{prefix}_scale"]
+                           + part[f"{prefix}_mean"]
+                           - current[f"{prefix}_mean"])
+                          / current[f"{prefix}_scale"])
+                part_df[columns] = values.astype(part_df[columns[0]].dtype)
+
+            revision = part.get("revision", 0) + 1
+            new_part = {**part, **current, "revision": revision,
+                        "file": f"part-{i:05d}.r{revision}.parquet"}
+            new_path = os.path.join(parts_dir, new_part["file"])
+            part_df.to_parquet(f"{new_path}.tmp", index=False)
+            os.replace(f"{new_path}.tmp", new_path)
+            self.state["parts"][i] = new_part
+            try:
+                self._save_state()
+            except Exception:
+                self.state["parts"][i] = part
+                raise
+            os.remove(os.path.join(parts_dir, part["file"]))
+
+    def load(self) -> pd.DataFrame:
+        """Load every stored part as one engineered DataFrame."""
+        parts = [pd.read_parquet(os.path.join(self.path, self.PARTS_DIR,
+                                              part["file"]))
+                 for part in self.state["parts"]]
+        if not parts:
+            return pd.DataFrame()
+        return pd.concat(parts, ignore_index=True)
+
+    def _encode_categories(self, delta: pd.DataFrame) -> pd.DataFrame:
+        """Fix the one-hot categories so every part gets the same columns."""
+        for col in get_features()['one_hot_encode_columns']:
+            categories = self.state["categories"][col]
+            unseen = set(delta[col].dropna().unique()) - set(categories)
+            if unseen:
+                raise ValueError(f"Unseen categories in {col}: "
+                                 f"{sorted(unseen)}. Rebuild the feature "
+                                 "store with them in `categories`.")
+            delta[col] = pd.Categorical(delta[col], categories=categories)
+        return delta
+
+    def _scaler_stats(self) -> dict:
+        return {"X_mean": self.state["X_scaler"].mean_.copy(),
+                "X_scale": self.state["X_scaler"].scale_.copy(),
+                "y_mean": self.state["y_scaler"].mean_.copy(),
+                "y_scale": self.state["y_scaler"].scale_.copy()}
+
+    def _save_state(self) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        state_path = os.path.join(self.path, self.STATE_FILE)
+        joblib.dump(self.state, f"{state_path}.tmp")
+        os.replace(f"{state_path}.tmp", state_path)
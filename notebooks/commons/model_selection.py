@@ -1,7 +1,6 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
-import xgboost as xgb
-import lightgbm as lgb
+import sys
+import numpy as np
+import pandas as pd
 from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
 from sklearn.ensemble import GradientBoostingRegressor, GradientBoostingClassifier
 
@@ -9,8 +8,149 @@ from sklearn.ensemble import GradientBoostingRegressor, GradientBoostingClassifi
 ## https://mlflow.org/docs/latest/traditional-ml/hyperparameter-tuning-with-child-runs/notebooks/hyperparameter-tuning-with-child-runs.html
 
 
+## Test sets larger than this are plotted as binned aggregates.
+BINNED_RESIDUALS_MIN_POINTS = 10_000
+
+
+def residual_summary(y_test, y_pred, n_bins: int=20,
+                     quantiles: tuple=(0.05, 0.25, 0.5, 0.75, 0.95)
+                     ) -> pd.DataFrame:
+    """
+    Summarize the residuals per bin of the true values.
+
+    Parameters
+    ----------
+    y_test : array-like or pd.Series
+        The true target values for the test set.
+    y_pred : array-like
+        The predicted target values.
+    n_bins : int, optional
+        Number of equal-width bins over the range of `y_test`.
+    quantiles : tuple of float, optional
+        Residual quantiles to report for each bin.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per bin with its edges, count, residual mean and standard
+        deviation, and a `q<percent>` column per requested quantile. Empty
+        bins have NaN statistics.
+    """
+    y_true = np.asarray(y_test, dtype="float64")
+    residuals = y_true - np.asarray(y_pred, dtype="float64")
+    edges = np.linspace(y_true.min(), y_true.max(), n_bins + 1)
+    bin_idx = np.digitize(y_true, edges[1:-1])
+
+    counts = np.bincount(bin_idx, minlength=n_bins)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.bincount(bin_idx, residuals, n_bins) / counts
+        variance = (np.bincount(bin_idx, residuals ** 2, n_bins) / counts
+                    - mean ** 2)
+
+    # Sort residuals within bins once, then interpolate every quantile of
+    # every bin from the bin offsets.
+    sorted_residuals = residuals[np.lexsort((residuals, bin_idx))]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    last = len(residuals) - 1
+    positions = (starts[:, None] + np.asarray(quantiles)[None, :]
+                 * np.maximum(counts - 1, 0)[:, None])
+    lower = np.clip(np.floor(positions).astype("int64"), 0, last)
+    upper = np.clip(np.minimum(lower + 1, (starts + counts - 1)[:, None]),
+                    0, last)
+    fraction = positions - np.floor(positions)
+    bin_quantiles = (sorted_residuals[lower] * (1 - fraction)
+                     + sorted_residuals[upper] * fraction)
+    bin_quantiles[counts == 0] = np.nan
+
+    summary = pd.DataFrame({
+        "bin_start": edges[:-1],
+        "bin_end": edges[1:],
+        "count": counts,
+        "mean_residual": mean,
+        "std_residual": np.sqrt(np.maximum(variance, 0)),
+    })
+    for i, q in enumerate(quantiles):
+        summary[f"q{q * 100:g}"] = bin_quantiles[:, i]
+    return summary
+
+
+def plot_binned_residuals(y_test, y_pred, summary: pd.DataFrame=None,
+                          n_bins: int=20, grid_size: int=60,
+                          save_path=None):
+    """
+    Plot a 2D histogram of the residuals against the true values, overlaid
+    with the per-bin residual mean and quantile bands.
+
+    The drawing cost depends on `grid_size` and `n_bins`, not on the number
+    of test points.
+
+    Parameters
+    ----------
+    y_test : array-like or pd.Series
+        The true target values for the test set.
+    y_pred : array-like
+        The predicted target values.
+    summary : pd.DataFrame, optional
+        Output of `residual_summary`. Computed with the default quantiles if
+        not provided.
+    n_bins : int, optional
+        Number of bins of the summary when it is computed here.
+    grid_size : int, optional
+        Number of histogram cells along each axis.
+    save_path : str, optional
+        File path to save the plot as a PNG. If None, the plot is only displayed.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        The generated residuals plot.
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from matplotlib.colors import LogNorm
+
+    y_true = np.asarray(y_test, dtype="float64")
+    residuals = y_true - np.asarray(y_pred, dtype="float64")
+    if summary is None:
+        summary = residual_summary(y_true, y_pred, n_bins=n_bins)
+    counts, x_edges, y_edges = np.histogram2d(y_true, residuals,
+                                              bins=grid_size)
+    centers = (summary["bin_start"] + summary["bin_end"]) / 2
+
+    sns.set_style("whitegrid",
+                  {"axes.facecolor": "#c2c4c2", "grid.linewidth": 1.5})
+    fig, ax = plt.subplots(figsize=(12, 8))
+    mesh = ax.pcolormesh(x_edges, y_edges,
+                         np.ma.masked_equal(counts.T, 0),
+                         cmap="Blues", norm=LogNorm())
+    fig.colorbar(mesh, ax=ax, label="Count")
+    if {"q5", "q95"} <= set(summary.columns):
+        ax.fill_between(centers, summary["q5"], summary["q95"],
+                        color="orange", alpha=0.2, label="5th-95th percentile")
+    if {"q25", "q75"} <= set(summary.columns):
+        ax.fill_between(centers, summary["q25"], summary["q75"],
+                        color="orange", alpha=0.4, label="Interquartile range")
+    ax.plot(centers, summary["mean_residual"], color="black",
+            marker="o", label="Mean residual")
+    ax.axhline(y=0, color="r", linestyle="-")
+
+    ax.set_title("Residuals vs True Values", fontsize=18)
+    ax.set_xlabel("True Values", fontsize=16)
+    ax.set_ylabel("Residuals", fontsize=16)
+    ax.tick_params(labelsize=14)
+    ax.legend(fontsize=12)
+    plt.tight_layout()
+
+    if save_path:
+        plt.savefig(save_path,
+                    format="png", dpi=600)
+
+    plt.close(fig)
+    return fig
+
+
 def plot_residuals(model: object, y_test, y_pred,
-                   save_path=None):
+                   save_path=None, binned: bool=None):
     """
     Plot the residuals of the model predictions against the true values.
 
@@ -24,12 +164,23 @@ def plot_residuals(model: object, y_test, y_pred,
         The true target values for the test set.
     save_path : str, optional
         File path to save the plot as a PNG. If None, the plot is only displayed.
+    binned : bool, optional
+        Draw the fixed-cost binned plot of `plot_binned_residuals` instead of
+        a scatter of every point. If None, it is used for test sets larger
+        than `BINNED_RESIDUALS_MIN_POINTS`.
 
     Returns
     -------
     matplotlib.figure.Figure
         The generated residuals plot.
     """
+    if binned is None:
+        binned = len(y_test) > BINNED_RESIDUALS_MIN_POINTS
+    if binned:
+        return plot_binned_residuals(y_test, y_pred, save_path=save_path)
+
+    import matplotlib.pyplot as plt
+    import seaborn as sns
 
     residuals = y_test - y_pred
     sns.set_style("whitegrid",
@@ -79,16 +230,23 @@ def plot_feature_importance(model, feature_names=None):
     fig : matplotlib.figure.Figure
         The matplotlib figure object.
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     fig, ax = plt.subplots(figsize=(10, 8))
+    # A model of a boosting library means the library is already imported,
+    # so the checks below never import it themselves.
+    xgb = sys.modules.get("xgboost")
+    lgb = sys.modules.get("lightgbm")
 
-    if isinstance(model, xgb.Booster) or isinstance(model, xgb.XGBModel):
+    if xgb is not None and isinstance(model, (xgb.Booster, xgb.XGBModel)):
         importance_type = "weight" if hasattr(model, "booster") and model.booster == "gblinear" else "gain"
         xgb.plot_importance(
             model, importance_type=importance_type, ax=ax,
             title=f"Feature Importance based on {importance_type}"
         )
 
-    elif isinstance(model, lgb.Booster) or isinstance(model, lgb.LGBMModel):
+    elif lgb is not None and isinstance(model, (lgb.Booster, lgb.LGBMModel)):
         importance = model.feature_importance(importance_type="gain")
         features = feature_names if feature_names else model.feature_name_
         sns.barplot(x=importance, y=features, ax=ax)
@@ -0,0 +1,311 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+
+CSV_COLUMNS = [
+    "Employee_ID", "Department", "Gender", "Age", "Job_Title", "Hire_Date",
+    "Years_At_Company", "Education_Level", "Performance_Score",
+    "Monthly_Salary", "Work_Hours_Per_Week", "Projects_Handled",
+    "Overtime_Hours", "Sick_Days", "Remote_Work_Frequency", "Team_Size",
+    "Training_Hours", "Promotions", "Employee_Satisfaction_Score", "Resigned"
+]
+TARGET_COLUMN = "Employee_Satisfaction_Score"
+
+
+def _uniform(values) -> dict:
+    values = list(values)
+    return {"values": values, "probs": [1 / len(values)] * len(values)}
+
+
+## Marginals observed in the Kaggle dataset. Use `fit_profile` to refit
+## them from a local copy of the CSV.
+DEFAULT_PROFILE = {
+    "categorical": {
+        "Department": _uniform([
+            "IT", "Finance", "Customer Support", "Engineering", "Marketing",
+            "HR", "Operations", "Sales", "Legal"
+        ]),
+        "Gender": {"values": ["Male", "Female", "Other"],
+                   "probs": [0.48, 0.48, 0.04]},
+        "Job_Title": _uniform([
+            "Specialist", "Developer", "Analyst", "Manager", "Technician",
+            "Engineer", "Consultant"
+        ]),
+        "Education_Level": {
+            "values": ["High School", "Bachelor", "Master", "PhD"],
+            "probs": [0.3, 0.5, 0.15, 0.05]
+        },
+        "Resigned": {"values": [False, True], "probs": [0.9, 0.1]},
+    },
+    "discrete": {
+        "Age": _uniform(range(22, 61)),
+        "Years_At_Company": _uniform(range(0, 11)),
+        "Performance_Score": _uniform(range(1, 6)),
+        "Work_Hours_Per_Week": _uniform(range(30, 61)),
+        "Projects_Handled": _uniform(range(0, 50)),
+        "Overtime_Hours": _uniform(range(0, 30)),
+        "Sick_Days": _uniform(range(0, 15)),
+        "Remote_Work_Frequency": _uniform([0, 25, 50, 75, 100]),
+        "Team_Size": _uniform(range(1, 30)),
+        "Training_Hours": _uniform(range(0, 100)),
+        "Promotions": _uniform(range(0, 3)),
+    },
+    "continuous": {
+        "Monthly_Salary": {"quantiles": np.linspace(3850, 9000, 101).tolist(),
+                           "decimals": -1},
+        TARGET_COLUMN: {"quantiles": np.linspace(1.0, 5.0, 101).tolist(),
+                        "decimals": 2},
+    },
+    "hire_date": {"start": "2014-09-01", "end": "2024-09-01"},
+    "satisfaction": {
+        "coefficients": {
+            "Performance_Score": 0.25, "Promotions": 0.15,
+            "Training_Hours": 0.10, "Remote_Work_Frequency": 0.05,
+            "Overtime_Hours": -0.15, "Work_Hours_Per_Week": -0.10,
+            "Sick_Days": -0.10
+        },
+        "noise": 0.9
+    }
+}
+
+
+def _moments(spec: dict) -> tuple[float, float]:
+    values = np.asarray(spec["values"], dtype="float64")
+    probs = np.asarray(spec["probs"], dtype="float64")
+    mean = values @ probs
+    return mean, np.sqrt(((values - mean) ** 2) @ probs)
+
+
+def _sample_discrete(rng: np.random.Generator, spec: dict, n_rows: int):
+    """Sample values by inverting the cumulative category frequencies."""
+    cdf = np.cumsum(spec["probs"], dtype="float64")
+    codes = np.searchsorted(cdf / cdf[-1], rng.random(n_rows), side="right")
+    return np.asarray(spec["values"])[codes]
+
+
+def fit_profile(data_df: pd.DataFrame, n_quantiles: int=101) -> dict:
+    """
+    Fit the generator profile to a copy of the raw employee dataset.
+
+    Parameters
+    ----------
+    data_df : pd.DataFrame
+        Raw employee records as loaded by `load_raw_data`.
+    n_quantiles : int, optional
+        Number of quantiles kept for the continuous columns.
+
+    Returns
+    -------
+    dict
+        A profile with the layout of `DEFAULT_PROFILE`, holding the observed
+        category frequencies, integer value frequencies, quantiles of the
+        continuous columns and a linear link from the numeric features to
+        the normal scores of `Employee_Satisfaction_Score`.
+    """
+    def frequencies(column):
+        counts = data_df[column].value_counts(normalize=True).sort_index()
+        return {"values": counts.index.tolist(),
+                "probs": counts.values.tolist()}
+
+    grid = np.linspace(0, 1, n_quantiles)
+    hire_dates = pd.to_datetime(data_df["Hire_Date"])
+    profile = {
+        "categorical": {column: frequencies(column)
+                        for column in DEFAULT_PROFILE["categorical"]},
+        "discrete": {column: frequencies(column)
+                     for column in DEFAULT_PROFILE["discrete"]},
+        "continuous": {
+            column: {"quantiles": data_df[column].quantile(grid).tolist(),
+                     "decimals": spec["decimals"]}
+            for column, spec in DEFAULT_PROFILE["continuous"].items()
+        },
+        "hire_date": {"start": str(hire_dates.min()),
+                      "end": str(hire_dates.max())},
+    }
+
+    link_columns = list(DEFAULT_PROFILE["satisfaction"]["coefficients"])
+    features = data_df[link_columns].to_numpy(dtype="float64")
+    features = (features - features.mean(axis=0)) / features.std(axis=0)
+    ranks = data_df[TARGET_COLUMN].rank(method="average").to_numpy()
+    normal_scores = ndtri(ranks / (len(ranks) + 1))
+    coefficients, *_ = np.linalg.lstsq(features, normal_scores, rcond=None)
+    residuals = normal_scores - features @ coefficients
+    profile["satisfaction"] = {
+        "coefficients": dict(zip(link_columns, coefficients.tolist())),
+        "noise": float(residuals.std())
+    }
+    return profile
+
+
+def generate_employee_data(n_rows: int,
+                           seed: int | np.random.SeedSequence=42,
+                           start_id: int=1,
+                           profile: dict=None) -> pd.DataFrame:
+    """
+    Generate synthetic employee records with the schema of
+    `Extended_Employee_Performance_and_Productivity_Data.csv`.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of records to generate.
+    seed : int or np.random.SeedSequence, optional
+        Seed of the random generator. The same seed gives the same rows.
+    start_id : int, optional
+        `Employee_ID` of the first generated record.
+    profile : dict, optional
+        Marginals to sample from. Defaults to `DEFAULT_PROFILE`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The generated records, in the column order of the CSV.
+
+    Notes
+    -----
+    `Employee_Satisfaction_Score` follows its fitted marginal exactly. Its
+    dependence on the other features comes from a Gaussian copula: a
+    linear score of the standardized features plus noise is mapped through
+    the normal CDF and then through the quantiles of the target.
+    """
+    profile = DEFAULT_PROFILE if profile is None else profile
+    rng = np.random.default_rng(seed)
+    data = {"Employee_ID": np.arange(start_id, start_id + n_rows,
+                                     dtype="int64")}
+
+    for column, spec in profile["categorical"].items():
+        data[column] = _sample_discrete(rng, spec, n_rows)
+    for column, spec in profile["discrete"].items():
+        data[column] = _sample_discrete(rng, spec, n_rows).astype("int64")
+
+    start = np.datetime64(profile["hire_date"]["start"], "s")
+    end = np.datetime64(profile["hire_date"]["end"], "s")
+    offsets = rng.integers(0, (end - start).astype("int64"), n_rows)
+    data["Hire_Date"] = ((start + offsets.astype("timedelta64[s]"))
+                         .astype("datetime64[ns]"))
+
+    link = profile["satisfaction"]
+    latent = rng.standard_normal(n_rows) * link["noise"]
+    for column, coefficient in link["coefficients"].items():
+        mean, std = _moments(profile["discrete"][column])
+        latent += coefficient * (data[column] - mean) / std
+    latent_std = np.sqrt(sum(c ** 2 for c in link["coefficients"].values())
+                         + link["noise"] ** 2)
+    uniforms = {TARGET_COLUMN: ndtr(latent / latent_std)}
+
+    for column, spec in profile["continuous"].items():
+        quantiles = np.asarray(spec["quantiles"], dtype="float64")
+        u = uniforms.get(column)
+        if u is None:
+            u = rng.random(n_rows)
+        grid = np.linspace(0, 1, len(quantiles))
+        data[column] = np.interp(u, grid, quantiles).round(spec["decimals"])
+
+    return pd.DataFrame(data, columns=CSV_COLUMNS)
+
+
+def _write_chunk(task: tuple) -> str:
+    """Generate one chunk and write it to its own part file."""
+    part_path, n_rows, seed, start_id, file_format, profile = task
+    chunk_df = generate_employee_data(n_rows, seed=seed, start_id=start_id,
+                                      profile=profile)
+    if file_format == "csv":
+        chunk_df.to_csv(part_path, index=False, header=False)
+    else:
+        chunk_df.to_parquet(part_path, index=False)
+    return part_path
+
+
+def write_synthetic_dataset(path: str, n_rows: int, seed: int=42,
+                            chunk_size: int=500_000,
+                            file_format: str="csv",
+                            n_jobs: int=None,
+                            profile: dict=None) -> str:
+    """
+    Generate a large synthetic dataset in parallel chunks and write it out.
+
+    Parameters
+    ----------
+    path : str
+        Output CSV file, or output directory of part files for parquet.
+    n_rows : int
+        Total number of records.
+    seed : int, optional
+        Root seed. Each chunk draws from its own child of this seed, so the
+        output only depends on `seed` and `chunk_size`, not on `n_jobs`.
+    chunk_size : int, optional
+        Records generated per task.
+    file_format : str, optional
+        Either 'csv' or 'parquet'.
+    n_jobs : int, optional
+        Number of worker processes. Defaults to the CPU count.
+    profile : dict, optional
+        Marginals to sample from. Defaults to `DEFAULT_PROFILE`.
+
+    Returns
+    -------
+    str
+        The path written to.
+
+    Raises
+    ------
+    ValueError
+        If `file_format` is not supported.
+    """
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(f"Unsupported file format: {file_format}")
+
+    n_chunks = max(1, -(-n_rows // chunk_size))
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    part_dir = (Path(path) if file_format == "parquet"
+                else Path(tempfile.mkdtemp(dir=Path(path).parent or None)))
+    os.makedirs(part_dir, exist_ok=True)
+
+    tasks = []
+    for i in range(n_chunks):
+        start = i * chunk_size
+        tasks.append((str(part_dir / f"part-{i:05d}.{file_format}"),
+                      min(chunk_size, n_rows - start), seeds[i], start + 1,
+                      file_format, profile))
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        part_paths = list(executor.map(_write_chunk, tasks))
+
+    if file_format == "csv":
+        ## Parts are written without headers, so they concatenate as bytes.
+        try:
+            with open(path, "w", newline="") as output:
+                output.write(",".join(CSV_COLUMNS) + "\n")
+            with open(path, "ab") as output:
+                for part_path in part_paths:
+                    with open(part_path, "rb") as part:
+                        shutil.copyfileobj(part, output)
+        finally:
+            shutil.rmtree(part_dir)
+    print(f"Wrote {n_rows} synthetic records to: {path}")
+    return str(path)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Write a synthetic employee performance dataset."
+    )
+    parser.add_argument("path")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=500_000)
+    parser.add_argument("--format", choices=["csv", "parquet"],
+                        default="csv")
+    parser.add_argument("--jobs", type=int, default=None)
+    args = parser.parse_args()
+    write_synthetic_dataset(args.path, args.rows, seed=args.seed,
+                            chunk_size=args.chunk_size,
+                            file_format=args.format, n_jobs=args.jobs)